@@ -1,4 +1,5 @@
 import mimetypes
+import os
 import shutil
 
 from pathlib import Path
@@ -63,11 +64,7 @@ class LocalFilesystemAdapter(FilesystemAdapter):
             errors = options.get("errors") if options else None
             with Path(path).open(mode, encoding=encoding, errors=errors) as wfile:
                 wfile.write(contents)
-        except IsADirectoryError as ex:
-            raise UnableToWriteFile.with_location(path, str(ex))
-        except FileNotFoundError as ex:
-            raise UnableToWriteFile.with_location(path, str(ex))
-        except PermissionError as ex:
+        except (IsADirectoryError, FileNotFoundError, PermissionError) as ex:
             raise UnableToWriteFile.with_location(path, str(ex))
 
     def write_stream(self, path: str, resource: IO, options: Dict[str, Any] = None):
@@ -84,21 +81,12 @@ class LocalFilesystemAdapter(FilesystemAdapter):
             encoding = options.get("encoding") if options else None
             mode = options.get("mode", "w") if options else "w"
             errors = options.get("errors") if options else None
-            chunk_size = options.get("chunk_size") if options else None
+            chunk_size = options.get("chunk_size", 0) if options else 0
             with Path(path).open(mode, encoding=encoding, errors=errors) as wfile:
-                if chunk_size:
-                    while True:
-                        chunk = resource.read(chunk_size)
-                        if not chunk:
-                            break
-                        wfile.write(chunk)
-                else:
-                    wfile.write(resource.read())
-        except IsADirectoryError as ex:
-            raise UnableToWriteFile.with_location(path, str(ex))
-        except FileNotFoundError as ex:
-            raise UnableToWriteFile.with_location(path, str(ex))
-        except PermissionError as ex:
+                # Copy chunk by chunk (shutil's default buffer size when no chunk size is given)
+                # so the whole stream is never held in memory
+                shutil.copyfileobj(resource, wfile, chunk_size)
+        except (IsADirectoryError, FileNotFoundError, PermissionError) as ex:
             raise UnableToWriteFile.with_location(path, str(ex))
 
     def read(self, path: str) -> str:
@@ -111,11 +99,7 @@ class LocalFilesystemAdapter(FilesystemAdapter):
         """
         try:
             contents = Path(path).read_text()
-        except IsADirectoryError as ex:
-            raise UnableToReadFile.with_location(path, str(ex))
-        except FileNotFoundError as ex:
-            raise UnableToReadFile.with_location(path, str(ex))
-        except PermissionError as ex:
+        except (IsADirectoryError, FileNotFoundError, PermissionError) as ex:
             raise UnableToReadFile.with_location(path, str(ex))
         return contents
 
@@ -129,11 +113,7 @@ class LocalFilesystemAdapter(FilesystemAdapter):
         """
         try:
             stream = Path(path).open("r")
-        except IsADirectoryError as ex:
-            raise UnableToReadFile.with_location(path, str(ex))
-        except FileNotFoundError as ex:
-            raise UnableToReadFile.with_location(path, str(ex))
-        except PermissionError as ex:
+        except (IsADirectoryError, FileNotFoundError, PermissionError) as ex:
             raise UnableToReadFile.with_location(path, str(ex))
         return stream
 
@@ -147,11 +127,7 @@ class LocalFilesystemAdapter(FilesystemAdapter):
         """
         try:
             Path(path).unlink()
-        except IsADirectoryError as ex:
-            raise UnableToDeleteFile.with_location(path, str(ex))
-        except FileNotFoundError as ex:
-            raise UnableToDeleteFile.with_location(path, str(ex))
-        except PermissionError as ex:
+        except (IsADirectoryError, FileNotFoundError, PermissionError) as ex:
             raise UnableToDeleteFile.with_location(path, str(ex))
 
     def delete_directory(self, path: str):
@@ -164,11 +140,7 @@ class LocalFilesystemAdapter(FilesystemAdapter):
         """
         try:
             shutil.rmtree(path)
-        except NotADirectoryError as ex:
-            raise UnableToDeleteDirectory.with_location(path, str(ex))
-        except FileNotFoundError as ex:
-            raise UnableToDeleteDirectory.with_location(path, str(ex))
-        except PermissionError as ex:
+        except (NotADirectoryError, FileNotFoundError, PermissionError) as ex:
             raise UnableToDeleteDirectory.with_location(path, str(ex))
         return True
 
@@ -221,9 +193,7 @@ class LocalFilesystemAdapter(FilesystemAdapter):
         """
         try:
             size = Path(path).stat().st_size
-        except IsADirectoryError as ex:
-            raise UnableToRetrieveMetadata.with_location(path, str(ex))
-        except FileNotFoundError as ex:
+        except (IsADirectoryError, FileNotFoundError) as ex:
             raise UnableToRetrieveMetadata.with_location(path, str(ex))
         return size
 
@@ -248,9 +218,7 @@ class LocalFilesystemAdapter(FilesystemAdapter):
         """
         try:
             time_modified = int(Path(path).stat().st_mtime * 1000)
-        except IsADirectoryError as ex:
-            raise UnableToRetrieveMetadata.with_location(path, str(ex))
-        except FileNotFoundError as ex:
+        except (IsADirectoryError, FileNotFoundError) as ex:
             raise UnableToRetrieveMetadata.with_location(path, str(ex))
         return time_modified
 
@@ -262,7 +230,29 @@ class LocalFilesystemAdapter(FilesystemAdapter):
         Returns:
             List all directories in the given directory
         """
-        return [str(path_) for path_ in Path(path).rglob("*.*")]
+        root = Path(path)
+        if not root.is_dir():
+            return []
+
+        # Walk with an explicit stack instead of recursion, "" stands for the current directory (no "./" prefix)
+        contents = []
+        directories = ["" if root == Path(".") else str(root)]
+        while directories:
+            directory = directories.pop()
+            try:
+                with os.scandir(directory or ".") as entries:
+                    children = list(entries)
+            except PermissionError:
+                continue
+            subdirectories = []
+            for entry in children:
+                entry_path = os.path.join(directory, entry.name)
+                if "." in entry.name:
+                    contents.append(entry_path)
+                if entry.is_dir(follow_symlinks=False):
+                    subdirectories.append(entry_path)
+            directories.extend(reversed(subdirectories))
+        return contents
 
     def copy(self, source: str, destination: str, options: Dict[str, Any] = None):
         """
@@ -276,9 +266,7 @@ class LocalFilesystemAdapter(FilesystemAdapter):
         """
         try:
             shutil.copy2(source, destination)
-        except IsADirectoryError as ex:
-            raise UnableToCopyFile.with_location(source, destination, str(ex))
-        except PermissionError as ex:
+        except (IsADirectoryError, PermissionError) as ex:
             raise UnableToCopyFile.with_location(source, destination, str(ex))
 
     def move(self, source: str, destination: str, options: Dict[str, Any] = None):
@@ -293,10 +281,6 @@ class LocalFilesystemAdapter(FilesystemAdapter):
         """
         try:
             shutil.move(source, destination)
-        except IsADirectoryError as ex:
-            raise UnableToMoveFile.with_location(source, destination, str(ex))
-        except FileNotFoundError as ex:
-            raise UnableToMoveFile.with_location(source, destination, str(ex))
         except OSError as ex:
             raise UnableToMoveFile.with_location(source, destination, str(ex))
 
@@ -1,9 +1,11 @@
-import os
+import posixpath
 
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
 from typing import IO, Any, Dict, List
 
 import boto3
 
+from boto3.s3.transfer import TransferConfig
 from botocore.client import ClientError, Config
 
 from ..adapters import FilesystemAdapter
@@ -28,17 +30,36 @@ class S3FilesystemAdapter(FilesystemAdapter):
     """
 
     def __init__(
-        self, endpoint_url: str, access_key_id: str, secret_access_key: str, bucket_name: str, region_name: str
+        self,
+        endpoint_url: str,
+        access_key_id: str,
+        secret_access_key: str,
+        bucket_name: str,
+        region_name: str,
+        max_workers: int = 8,
+        transfer_config: TransferConfig = None,
     ) -> None:
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be greater than 0, received {max_workers}")
+        # Keep boto3's multipart threshold and part size, send up to max_workers parts at once (never below 10)
+        self._transfer_config = transfer_config or TransferConfig(max_concurrency=max(max_workers, 10))
         session = boto3.Session(aws_access_key_id=access_key_id, aws_secret_access_key=secret_access_key)
-        self._s3 = session.resource(
-            "s3", endpoint_url=endpoint_url, region_name=region_name, config=Config(signature_version="s3v4")
-        )
-        self._client = session.client(
-            "s3", endpoint_url=endpoint_url, region_name=region_name, config=Config(signature_version="s3v4")
+        config = Config(
+            signature_version="s3v4",
+            # Retry throttling, 5xx and transient connection errors with exponential backoff and jitter
+            retries={"total_max_attempts": 5, "mode": "standard"},
+            # Keep a pooled (TLS) connection per worker or part thread, plus one for the calling thread that lists or
+            # reads while they transfer, instead of opening new ones (botocore keeps only 10 by default)
+            max_pool_connections=max(max(max_workers, self._transfer_config.max_request_concurrency) + 1, 10),
+            # Open sockets with SO_KEEPALIVE, when probes start is left to the OS keepalive settings
+            tcp_keepalive=True,
         )
+        self._s3 = session.resource("s3", endpoint_url=endpoint_url, region_name=region_name, config=config)
+        # Reuse the resource's low-level client rather than building (and loading the service model for) a second one
+        self._client = self._s3.meta.client
         self._bucket_name = bucket_name
         self._bucket = self._s3.Bucket(bucket_name)
+        self._max_workers = max_workers
 
     def file_exists(self, path: str) -> bool:
         """
@@ -65,12 +86,9 @@ class S3FilesystemAdapter(FilesystemAdapter):
             True if the directory existed
         """
         try:
-            paginator = self._client.get_paginator("list_objects_v2")
-            page_iterator = paginator.paginate(Bucket=self._bucket_name, Prefix=path)
-            for page in page_iterator:
-                if "Contents" in page:
-                    return True
-            return False
+            # One key is enough to prove the prefix exists, no need to list (and parse) a full page
+            response = self._client.list_objects_v2(Bucket=self._bucket_name, Prefix=path, MaxKeys=1)
+            return "Contents" in response
         except ClientError as ex:
             raise UnableToCheckDirectoryExistence.with_location(path, str(ex))
 
@@ -100,7 +118,11 @@ class S3FilesystemAdapter(FilesystemAdapter):
             None
         """
         try:
-            self._client.upload_fileobj(resource, self._bucket_name, path)
+            # Optional progress callback, called with the number of bytes sent since its previous call across all parts
+            callback = options.get("callback") if options else None
+            self._client.upload_fileobj(
+                resource, self._bucket_name, path, Callback=callback, Config=self._transfer_config
+            )
         except ClientError as ex:
             raise UnableToWriteFile.with_location(path, str(ex))
         except TypeError as ex:
@@ -175,24 +197,33 @@ class S3FilesystemAdapter(FilesystemAdapter):
             True if the directory is deleted successfully
         """
         try:
-            # List all objects with the directory prefix
-            objects_to_delete = []
             paginator = self._client.get_paginator("list_objects_v2")
             page_iterator = paginator.paginate(Bucket=self._bucket_name, Prefix=path)
-            for page in page_iterator:
-                objects_to_delete.extend(page.get("Contents", []))
 
-            # Delete the objects in batches of 1000 (S3 limit)
-            while objects_to_delete:
-                objects_batch = objects_to_delete[:1000]
-                self._client.delete_objects(
-                    Bucket=self._bucket_name, Delete={"Objects": [{"Key": obj_key["Key"]} for obj_key in objects_batch]}
-                )
-                objects_to_delete = objects_to_delete[1000:]
+            # Each page holds at most 1000 keys (the DeleteObjects limit), so a page is deleted as soon as it is
+            # listed, keeping at most `max_workers` batches in flight and refilling as each one completes
+            inflight = set()
+            with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+                for page in page_iterator:
+                    objects = page.get("Contents", [])
+                    if not objects:
+                        continue
+                    if len(inflight) >= self._max_workers:
+                        done, inflight = wait(inflight, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            future.result()
+                    inflight.add(executor.submit(self._delete_objects, objects))
+                for future in as_completed(inflight):
+                    future.result()
         except ClientError as ex:
             raise UnableToDeleteDirectory.with_location(path, str(ex))
         return True
 
+    def _delete_objects(self, objects: List[Dict[str, Any]]):
+        self._client.delete_objects(
+            Bucket=self._bucket_name, Delete={"Objects": [{"Key": obj["Key"]} for obj in objects]}
+        )
+
     def create_directory(self, path: str, options: Dict[str, Any] = None):
         """
         Create a directory.
@@ -298,9 +329,7 @@ class S3FilesystemAdapter(FilesystemAdapter):
 
             # Collect all file keys (names) within the directory
             for page in page_iterator:
-                if "Contents" in page:
-                    for obj in page["Contents"]:
-                        file_keys.append(obj["Key"])
+                file_keys.extend(obj["Key"] for obj in page.get("Contents", []))
         except ClientError:
             return []
         return file_keys
@@ -318,7 +347,7 @@ class S3FilesystemAdapter(FilesystemAdapter):
         if source.endswith("/"):
             raise UnableToCopyFile.with_location(source, destination, "Could not copy directory to file")
         if destination.endswith("/"):
-            destination = os.path.join(destination, os.path.basename(source))
+            destination = posixpath.join(destination, posixpath.basename(source))
         try:
             self._bucket.Object(destination).copy_from(CopySource={"Bucket": self._bucket_name, "Key": source})
         except ClientError as ex:
@@ -337,7 +366,7 @@ class S3FilesystemAdapter(FilesystemAdapter):
         if source.endswith("/"):
             raise UnableToMoveFile.with_location(source, destination, "Could not move directory to file")
         if destination.endswith("/"):
-            destination = os.path.join(destination, os.path.basename(source))
+            destination = posixpath.join(destination, posixpath.basename(source))
         try:
             self._bucket.Object(destination).copy_from(CopySource={"Bucket": self._bucket_name, "Key": source})
             self._bucket.Object(source).delete()
@@ -355,15 +384,19 @@ class S3FilesystemAdapter(FilesystemAdapter):
         """
         if path.endswith("/"):
             raise UnableToGenerateTemporaryUrl.with_location(path, "Could not generate url for a directory")
+        # Validate the expired time before any request is sent, S3 rejects pre-signed urls valid for more than 1 week
+        max_expired_time = 7 * 24 * 3600  # default is 1 week
+        expired_time = options.get("expired_time", max_expired_time) if options else max_expired_time
+        if not isinstance(expired_time, int) or isinstance(expired_time, bool):
+            raise UnableToGenerateTemporaryUrl.with_location(path, "Expired time must be an integer")
+        if not 0 < expired_time <= max_expired_time:
+            raise UnableToGenerateTemporaryUrl.with_location(
+                path, f"Expired time must be between 1 and {max_expired_time} seconds"
+            )
+
         if not self.file_exists(path):
             raise UnableToGenerateTemporaryUrl.with_location(path, "File does not exist")
         try:
-            default_expired_time = 7 * 24 * 3600  # default is 1 week
-            if options is not None:
-                expired_time = options.get("expired_time", default_expired_time)
-            else:
-                expired_time = default_expired_time
-
             url = self._client.generate_presigned_url(
                 "get_object",
                 Params={
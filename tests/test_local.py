@@ -185,6 +185,28 @@ def test_list_contents(path: str, expected: str):
     assert filesystem.list_contents(path) == expected
 
 
+@pytest.mark.parametrize(
+    "path,expected",
+    (
+        (".", ["sub.d", "sub.d/b.txt", "sub.d/inner/c.txt"]),
+        ("sub.d", ["sub.d/b.txt", "sub.d/inner/c.txt"]),
+        ("./sub.d/", ["sub.d/b.txt", "sub.d/inner/c.txt"]),
+        ("link", ["link/b.txt", "link/inner/c.txt"]),
+        ("sub.d/b.txt", []),
+        ("missing", []),
+    ),
+)
+def test_list_contents_nested(tmp_path, monkeypatch, path: str, expected: list):
+    # sub.d/{b.txt, inner/c.txt}, plus a file without extension and a symlink to sub.d that must not be followed
+    (tmp_path / "sub.d" / "inner").mkdir(parents=True)
+    (tmp_path / "sub.d" / "b.txt").write_text("b")
+    (tmp_path / "sub.d" / "inner" / "c.txt").write_text("c")
+    (tmp_path / "noext").write_text("")
+    (tmp_path / "link").symlink_to(tmp_path / "sub.d", target_is_directory=True)
+    monkeypatch.chdir(tmp_path)
+    assert filesystem.list_contents(path) == expected
+
+
 @pytest.mark.parametrize(
     "source,destination,error",
     (
@@ -1,17 +1,23 @@
 import io
 import os
+import threading
 import time
 import urllib.request
 
 from typing import IO
+from unittest import mock
 
 import pytest
 
+from boto3.s3.transfer import TransferConfig
+from botocore.client import ClientError
+
 from flysystem.adapters.s3 import S3FilesystemAdapter
 from flysystem.error import (
     UnableToCheckExistence,
     UnableToCopyFile,
     UnableToCreateDirectory,
+    UnableToDeleteDirectory,
     UnableToDeleteFile,
     UnableToGenerateTemporaryUrl,
     UnableToMoveFile,
@@ -29,6 +35,23 @@ filesystem = S3FilesystemAdapter(
 )
 
 
+def make_offline_filesystem(**kwargs) -> S3FilesystemAdapter:
+    return S3FilesystemAdapter(
+        endpoint_url="http://localhost",
+        access_key_id="key",
+        secret_access_key="secret",
+        bucket_name="bucket",
+        region_name="us-east-1",
+        **kwargs,
+    )
+
+
+@pytest.mark.parametrize("max_workers", (0, -1))
+def test_invalid_max_workers(max_workers: int):
+    with pytest.raises(ValueError):
+        make_offline_filesystem(max_workers=max_workers)
+
+
 @pytest.mark.parametrize(
     "path,expected,error",
     (
@@ -64,20 +87,25 @@ def test_write(path: str, expected: str, error: Exception):
 
 
 @pytest.mark.parametrize(
-    "path,expected,error",
+    "path,expected,with_callback,error",
     (
-        ("tests/tmp2.txt", io.BytesIO(b"hello world"), None),
-        ("tests/tmp.txt", io.StringIO("hello world"), UnableToWriteFile),
-        ("/", io.BytesIO(b"hello world"), UnableToWriteFile),
+        ("tests/tmp2.txt", io.BytesIO(b"hello world"), False, None),
+        ("tests/tmp2.txt", io.BytesIO(b"hello world"), True, None),
+        ("tests/tmp.txt", io.StringIO("hello world"), False, UnableToWriteFile),
+        ("/", io.BytesIO(b"hello world"), False, UnableToWriteFile),
     ),
 )
-def test_write_stream(path: str, expected: IO, error: Exception):
+def test_write_stream(path: str, expected: IO, with_callback: bool, error: Exception):
     value = expected.getvalue()
+    transferred = []
+    options = {"callback": transferred.append} if with_callback else None
     if error is not None:
         with pytest.raises(error):
-            filesystem.write_stream(path, expected)
+            filesystem.write_stream(path, expected, options)
     else:
-        filesystem.write_stream(path, expected)
+        filesystem.write_stream(path, expected, options)
+        if with_callback:
+            assert sum(transferred) == len(value)
         if isinstance(value, bytes):
             value = value.decode("utf-8")
         assert filesystem.read(path) == value
@@ -228,6 +256,26 @@ def test_temporary_url(path: str, expected: bytes, error: Exception):
             assert response.status == 200 and response.read() == expected
 
 
+@pytest.mark.parametrize(
+    "expired_time",
+    ("one day", "3600", None, True, 1.9, 0.5, 0, 7 * 24 * 3600 + 1),
+)
+def test_temporary_url_with_invalid_expired_time(expired_time):
+    with pytest.raises(UnableToGenerateTemporaryUrl):
+        filesystem.temporary_url("tests/tmp.txt", {"expired_time": expired_time})
+
+
+@pytest.mark.parametrize("expired_time", (1, 3600, 7 * 24 * 3600))
+def test_temporary_url_with_expired_time(expired_time: int):
+    adapter = make_offline_filesystem()
+    adapter._client = mock.Mock()
+    adapter._client.generate_presigned_url.return_value = "https://example.com/tests/tmp.txt"
+    with mock.patch.object(adapter, "file_exists", return_value=True):
+        url = adapter.temporary_url("tests/tmp.txt", {"expired_time": expired_time})
+    assert url == "https://example.com/tests/tmp.txt"
+    assert adapter._client.generate_presigned_url.call_args.kwargs["ExpiresIn"] == expired_time
+
+
 @pytest.mark.parametrize(
     "source,destination,error",
     (
@@ -291,3 +339,82 @@ def test_delete(path: str, error: Exception):
 )
 def test_delete_directory(path: str, expected: bool):
     assert filesystem.delete_directory(path) == expected
+
+
+def test_write_stream_with_transfer_config():
+    # Small parts so a 6 MB stream goes through the multipart upload path
+    adapter = S3FilesystemAdapter(
+        endpoint_url=os.getenv("AWS_S3_ENDPOINT"),
+        access_key_id=os.getenv("AWS_ACCESS_KEY_ID"),
+        secret_access_key=os.getenv("AWS_SECRET_ACCESS_KEY"),
+        bucket_name=os.getenv("AWS_S3_BUCKET"),
+        region_name=os.getenv("AWS_DEFAULT_REGION"),
+        transfer_config=TransferConfig(
+            multipart_threshold=5 * 1024 * 1024, multipart_chunksize=5 * 1024 * 1024, max_concurrency=2
+        ),
+    )
+    contents = os.urandom(6 * 1024 * 1024)
+    adapter.write_stream("transfer/large.bin", io.BytesIO(contents))
+    assert adapter.read_bytes("transfer/large.bin") == contents
+    adapter.delete("transfer/large.bin")
+
+
+@pytest.mark.parametrize(
+    "max_workers,transfer_config,expected",
+    (
+        (8, None, 11),
+        (32, None, 33),
+        (8, TransferConfig(max_concurrency=32), 33),
+        (2, TransferConfig(max_concurrency=2), 10),
+    ),
+)
+def test_connection_pool_size(max_workers: int, transfer_config: TransferConfig, expected: int):
+    adapter = make_offline_filesystem(max_workers=max_workers, transfer_config=transfer_config)
+    assert adapter._client.meta.config.max_pool_connections == expected
+
+
+def make_batch_filesystem(keys: list, delete_objects) -> S3FilesystemAdapter:
+    # Four listing pages (1000, 1000, 1000 and 500 keys) for two workers, so the in-flight window has to refill
+    adapter = make_offline_filesystem(max_workers=2)
+    pages = [keys[:1000], keys[1000:2000], keys[2000:3000], keys[3000:]]
+    adapter._client = mock.Mock()
+    adapter._client.get_paginator.return_value.paginate.return_value = (
+        {"Contents": [{"Key": key} for key in page]} for page in pages
+    )
+    adapter._client.delete_objects.side_effect = delete_objects
+    return adapter
+
+
+def test_delete_directory_in_batches():
+    keys = [f"tests/batch/{index}.txt" for index in range(3500)]
+    remaining = set(keys)
+    running = {"current": 0, "peak": 0}
+    lock = threading.Lock()
+
+    def delete_objects(Bucket: str, Delete: dict):
+        with lock:
+            running["current"] += 1
+            running["peak"] = max(running["peak"], running["current"])
+        time.sleep(0.05)
+        with lock:
+            running["current"] -= 1
+            remaining.difference_update(obj["Key"] for obj in Delete["Objects"])
+
+    adapter = make_batch_filesystem(keys, delete_objects)
+    assert adapter.delete_directory("tests/batch/") is True
+    assert adapter._client.delete_objects.call_count == 4
+    assert not remaining
+    # Batches overlap, but never more than max_workers (2) of them at once
+    assert 1 < running["peak"] <= 2
+
+
+def test_delete_directory_with_failing_batch():
+    keys = [f"tests/batch/{index}.txt" for index in range(3500)]
+
+    def delete_objects(Bucket: str, Delete: dict):
+        if Delete["Objects"][0]["Key"] == keys[1000]:
+            raise ClientError({"Error": {"Code": "AccessDenied", "Message": "Access Denied"}}, "DeleteObjects")
+
+    adapter = make_batch_filesystem(keys, delete_objects)
+    with pytest.raises(UnableToDeleteDirectory):
+        adapter.delete_directory("tests/batch/")